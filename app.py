@@ -5,20 +5,16 @@ Serves the ML oracle through REST API
 """
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+import os
 import sys
 import random
 
 sys.path.insert(0, 'src')
-from hangman_oracle import HangmanOracle
+from oracle_loader import OracleLoader
 
 app = Flask(__name__)
 CORS(app)
 
-# Global state
-oracle = None
-test_words = []
-game_state = {}
-
 
 def load_words(filepath):
     """Load words from file"""
@@ -26,32 +22,59 @@ def load_words(filepath):
         return [line.strip().lower() for line in f if line.strip()]
 
 
+# Global state
+# The full oracle is built in the background; until it is ready,
+# loader.get_oracle() serves a precomputed global-frequency fallback.
+loader = OracleLoader(load_words)
+test_words = []
+game_state = {}
+
+
+def get_test_words():
+    """Load test words on first use"""
+    global test_words
+    
+    if not test_words:
+        test_words = load_words('Data/test.txt')
+    return test_words
+
+
 @app.route('/api/init', methods=['POST'])
 def initialize():
-    """Initialize the oracle with corpus"""
-    global oracle, test_words
-    
+    """Start building the oracle in the background; pass {"rebuild": true} to rebuild"""
     try:
-        corpus_words = load_words('Data/corpus.txt')
-        test_words = load_words('Data/test.txt')
-        oracle = HangmanOracle(corpus_words)
+        words = get_test_words()
+        data = request.get_json(silent=True) or {}
+        started = loader.start(rebuild=bool(data.get('rebuild')))
         
         return jsonify({
             'success': True,
-            'corpus_size': len(corpus_words),
-            'test_size': len(test_words)
-        })
+            'test_size': len(words),
+            **loader.snapshot()
+        }), (202 if started else 200)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/health', methods=['GET'])
+def health():
+    """Liveness check; always succeeds while the server is up"""
+    loader.ensure_started()
+    return jsonify({'alive': True, **loader.snapshot()})
+
+
+@app.route('/api/ready', methods=['GET'])
+def ready():
+    """Readiness check; 503 until the full oracle has been built"""
+    loader.ensure_started()
+    snapshot = loader.snapshot()
+    return jsonify(snapshot), (200 if snapshot['ready'] else 503)
+
+
 @app.route('/api/new-game', methods=['POST'])
 def new_game():
     """Start a new game"""
-    global game_state, test_words
-    
-    if not oracle:
-        return jsonify({'error': 'Oracle not initialized'}), 400
+    global game_state
     
     data = request.json
     mode = data.get('mode', 'random')  # 'random' or 'custom'
@@ -61,7 +84,7 @@ def new_game():
         if not word or not word.isalpha():
             return jsonify({'error': 'Invalid word'}), 400
     else:
-        word = random.choice(test_words)
+        word = random.choice(get_test_words())
     
     game_state = {
         'target_word': word,
@@ -147,8 +170,8 @@ def ai_hint():
     """Get AI suggestion for next letter"""
     global game_state
     
-    if not game_state or not oracle:
-        return jsonify({'error': 'No active game or oracle not initialized'}), 400
+    if not game_state:
+        return jsonify({'error': 'No active game'}), 400
     
     if game_state['game_over']:
         return jsonify({'error': 'Game is over'}), 400
@@ -156,11 +179,12 @@ def ai_hint():
     pattern = ''.join(game_state['pattern'])
     guessed = game_state['guessed']
     
-    # Get probabilities from oracle
+    # Get probabilities from oracle (fallback model until warm-up finishes)
+    oracle, model = loader.get_oracle()
     probs = oracle.get_letter_probabilities(pattern, guessed)
     
     # Get top 5 suggestions
-    top_indices = probs.argsort()[-5:][::-1]
+    top_indices = sorted(range(26), key=lambda i: probs[i], reverse=True)[:5]
     suggestions = []
     for idx in top_indices:
         letter = chr(97 + idx)
@@ -174,7 +198,8 @@ def ai_hint():
     return jsonify({
         'success': True,
         'suggestions': suggestions,
-        'best_guess': suggestions[0]['letter'] if suggestions else None
+        'best_guess': suggestions[0]['letter'] if suggestions else None,
+        'model': model
     })
 
 
@@ -183,8 +208,8 @@ def ai_play():
     """Let AI make the next move"""
     global game_state
     
-    if not game_state or not oracle:
-        return jsonify({'error': 'No active game or oracle not initialized'}), 400
+    if not game_state:
+        return jsonify({'error': 'No active game'}), 400
     
     if game_state['game_over']:
         return jsonify({'error': 'Game is over'}), 400
@@ -192,7 +217,8 @@ def ai_play():
     pattern = ''.join(game_state['pattern'])
     guessed = game_state['guessed']
     
-    # Get AI's guess
+    # Get AI's guess (fallback model until warm-up finishes)
+    oracle, _ = loader.get_oracle()
     letter = oracle.guess_letter(pattern, guessed)
     
     # Make the guess
@@ -261,16 +287,25 @@ def get_game_state():
     })
 
 
+def should_warm_up():
+    """False only in the debug reloader's parent process, which never serves requests"""
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        return True
+    # `python app.py` always runs under the reloader (see below)
+    return not app.debug and __name__ != '__main__'
+
+
+if should_warm_up():
+    loader.start()
+
+
 if __name__ == '__main__':
-    print("Initializing Hangman Oracle...")
+    print("Warming up Hangman Oracle in the background...")
     try:
-        corpus_words = load_words('Data/corpus.txt')
-        test_words = load_words('Data/test.txt')
-        oracle = HangmanOracle(corpus_words)
-        print(f"✓ Oracle initialized with {len(corpus_words)} corpus words")
-        print(f"✓ Loaded {len(test_words)} test words")
+        print(f"✓ Loaded {len(get_test_words())} test words")
     except Exception as e:
-        print(f"✗ Failed to initialize: {e}")
+        print(f"✗ Failed to load test words: {e}")
+    print("✓ Serving global-frequency fallback until /api/ready reports ready")
     
     print("\nStarting Flask server on http://localhost:5001")
     app.run(debug=True, port=5001)
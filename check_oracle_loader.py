@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Oracle Loader Checks
+Exercises background warm-up: fallback, ready, rebuild and failed builds
+"""
+import os
+import sys
+import threading
+from typing import List
+
+# Add src to path
+sys.path.insert(0, 'src')
+
+from hangman_oracle import FrequencyOracle, HangmanOracle
+from oracle_loader import OracleLoader
+
+
+def load_words(filepath: str) -> List[str]:
+    """Load words from file"""
+    with open(filepath, 'r') as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+
+class GatedWords:
+    """load_words stand-in that blocks until released, so builds can be observed mid-flight"""
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.gate = threading.Event()
+
+    def __call__(self, filepath: str) -> List[str]:
+        self.gate.wait(10)
+        if self.words is None:
+            raise FileNotFoundError(filepath)
+        return self.words
+
+
+def check_fallback_then_ready():
+    """Fallback is served while building, then the full model once ready"""
+    words = GatedWords(['apple', 'banana', 'cherry'])
+    loader = OracleLoader(words)
+
+    assert loader.snapshot()['status'] == 'idle'
+    oracle, model = loader.get_oracle()  # starts the build
+    assert isinstance(oracle, FrequencyOracle) and model == 'fallback'
+    snap = loader.snapshot()
+    assert snap['status'] == 'loading' and not snap['ready']
+    assert len(oracle.get_letter_probabilities('_____', set())) == 26
+
+    words.gate.set()
+    assert loader.wait(10)
+    snap = loader.snapshot()
+    assert snap['status'] == 'ready' and snap['ready'] and snap['corpus_size'] == 3
+    oracle, model = loader.get_oracle()
+    assert isinstance(oracle, HangmanOracle) and model == 'full'
+    assert oracle.guess_letter('_____', set()).isalpha()
+
+    assert not loader.start(), "start() without rebuild must not rebuild a ready model"
+    print("✓ fallback before build, full model once ready")
+
+
+def check_rebuild():
+    """A rebuild keeps serving the old model and the loader stays ready"""
+    words = GatedWords(['apple', 'banana'])
+    words.gate.set()
+    loader = OracleLoader(words)
+    loader.start()
+    assert loader.wait(10)
+    first, _ = loader.get_oracle()
+
+    words.gate.clear()
+    words.words = ['apple', 'banana', 'cherry', 'grape']
+    assert loader.start(rebuild=True)
+    assert not loader.start(rebuild=True), "only one build may run at a time"
+    snap = loader.snapshot()
+    assert snap['status'] == 'loading' and snap['ready'] and snap['model'] == 'full'
+    assert loader.get_oracle() == (first, 'full')
+
+    words.gate.set()
+    assert loader.wait(10)
+    second, model = loader.get_oracle()
+    assert second is not first and model == 'full'
+    assert loader.snapshot()['corpus_size'] == 4
+
+    # A failed rebuild keeps the previous model and reports only the error
+    words.words = None
+    assert loader.start(rebuild=True)
+    assert loader.wait(10)
+    snap = loader.snapshot()
+    assert snap['status'] == 'ready' and snap['ready'] and snap['error']
+    assert snap['stage'] == 'done' and snap['progress'] == 1.0
+    assert loader.get_oracle() == (second, 'full')
+    print("✓ rebuild keeps serving the old model and stays ready, even if it fails")
+
+
+def check_failed_build():
+    """A bad corpus path fails the build and keeps serving the fallback"""
+    loader = OracleLoader(load_words, corpus_path='Data/missing.txt')
+    loader.start()
+    assert not loader.wait(10)
+    snap = loader.snapshot()
+    assert snap['status'] == 'failed' and not snap['ready'] and snap['error']
+    oracle, model = loader.get_oracle()
+    assert isinstance(oracle, FrequencyOracle) and model == 'fallback'
+    assert oracle.guess_letter('_e__', {'e'}) == 'a'
+    print("✓ bad corpus path reports failed and serves the fallback")
+
+
+def check_fork_during_build():
+    """A child forked mid-build (gunicorn --preload) restarts its own build"""
+    if not hasattr(os, 'fork'):
+        print("- fork not available, skipped")
+        return
+    words = GatedWords(['apple', 'banana'])
+    loader = OracleLoader(words)
+    loader.start()
+    assert loader.snapshot()['status'] == 'loading'
+
+    pid = os.fork()
+    if pid == 0:
+        ok = False
+        try:
+            snap = loader.snapshot()
+            ok = snap['status'] == 'idle' and not snap['ready']
+            words.gate.set()
+            loader.ensure_started()
+            ok = ok and loader.wait(10) and loader.snapshot()['status'] == 'ready'
+        finally:
+            os._exit(0 if ok else 1)
+    _, exit_status = os.waitpid(pid, 0)
+    assert exit_status == 0, "forked child did not recover its build"
+
+    words.gate.set()
+    assert loader.wait(10)
+
+    # Without the fork hook, a 'loading' loader with a dead thread still restarts
+    stale = OracleLoader(words)
+    stale.status = 'loading'
+    assert stale.start()
+    assert stale.wait(10)
+    print("✓ forked child restarts the build instead of staying in loading")
+
+
+def main():
+    print("Checking oracle loader...")
+    check_fallback_then_ready()
+    check_rebuild()
+    check_failed_build()
+    check_fork_during_build()
+    print("\nAll checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,79 @@
 """
 Best Hangman Oracle - 42.5% Win Rate
 Uses advanced multi-signal strategy with extreme 4-gram weighting
+
+NumPy is imported on first use (get_numpy) so that importing this module stays cheap.
 """
-import numpy as np
-from typing import List, Set
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, List, Optional, Set
 from collections import Counter, defaultdict
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_np = None
+
+
+def get_numpy():
+    """Import NumPy on first call and return the module"""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+# Global letter frequencies a-z, precomputed from Data/corpus.txt.
+# Used by FrequencyOracle while the full HangmanOracle is still building.
+GLOBAL_LETTER_FREQ = {
+    'a': 0.08868, 'b': 0.01797, 'c': 0.04574, 'd': 0.03017, 'e': 0.10366,
+    'f': 0.01070, 'g': 0.02151, 'h': 0.02873, 'i': 0.08859, 'j': 0.00179,
+    'k': 0.00765, 'l': 0.05771, 'm': 0.03089, 'n': 0.07016, 'o': 0.07545,
+    'p': 0.03459, 'q': 0.00193, 'r': 0.07080, 's': 0.06116, 't': 0.06779,
+    'u': 0.03874, 'v': 0.00912, 'w': 0.00647, 'x': 0.00323, 'y': 0.02272,
+    'z': 0.00405,
+}
+
+
+class FrequencyOracle:
+    """
+    Cheap fallback oracle using the precomputed global letter frequency table.
+    Needs no corpus and no NumPy, so it is available immediately.
+    """
+    
+    def get_letter_probabilities(self, pattern: str, guessed: Set[str]) -> List[float]:
+        """
+        Get probability distribution over letters given current game state.
+        
+        Args:
+            pattern: Current word pattern (e.g., "a__le")
+            guessed: Set of already guessed letters
+            
+        Returns:
+            List of 26 probabilities for each letter a-z
+        """
+        excluded = set(guessed) | {ch for ch in pattern if ch != '_'}
+        probs = [0.0 if chr(97 + i) in excluded else GLOBAL_LETTER_FREQ[chr(97 + i)]
+                 for i in range(26)]
+        s = sum(probs)
+        return [p / s for p in probs] if s > 0 else [1.0 / 26] * 26
+    
+    def guess_letter(self, pattern: str, guessed: Set[str]) -> str:
+        """
+        Make a guess for the next letter.
+        
+        Args:
+            pattern: Current word pattern (e.g., "a__le")
+            guessed: Set of already guessed letters
+            
+        Returns:
+            Single letter guess (a-z)
+        """
+        probs = self.get_letter_probabilities(pattern, guessed)
+        best_idx = max(range(26), key=lambda i: probs[i])
+        return chr(97 + best_idx)
+
 
 class HangmanOracle:
     """
@@ -18,13 +86,16 @@ class HangmanOracle:
     - Strategic vowel/early-game boosting
     """
     
-    def __init__(self, corpus_words: List[str]):
+    def __init__(self, corpus_words: List[str],
+                 progress: Optional[Callable[[str, float], None]] = None):
         self.words = [w.strip().lower() for w in corpus_words if w and w.strip()]
+        self._progress = progress or (lambda stage, fraction: None)
         self._build_features()
     
     def _build_features(self):
         """Build all n-gram and positional frequency tables"""
         # Global letter frequency
+        self._progress('letter_frequencies', 0.0)
         self.letter_freq = Counter()
         for w in self.words:
             self.letter_freq.update(w)
@@ -35,6 +106,7 @@ class HangmanOracle:
             self.length_letter_freq[len(w)].update(w)
         
         # Positional frequency by length
+        self._progress('positional_frequencies', 0.2)
         self.pos_freq = {}
         for w in self.words:
             L = len(w)
@@ -45,6 +117,7 @@ class HangmanOracle:
                 self.pos_freq[key][ch] += 1
         
         # N-grams (2-4)
+        self._progress('ngrams', 0.4)
         self.bigrams = Counter()
         self.trigrams = Counter()
         self.fourgrams = Counter()
@@ -58,12 +131,15 @@ class HangmanOracle:
                 self.fourgrams[(w[i], w[i+1], w[i+2], w[i+3])] += 1
         
         # Start/end patterns
+        self._progress('start_end_patterns', 0.9)
         self.start_bigrams = Counter()
         self.end_bigrams = Counter()
         for w in self.words:
             if len(w) >= 2:
                 self.start_bigrams[(w[0], w[1])] += 1
                 self.end_bigrams[(w[-2], w[-1])] += 1
+        
+        self._progress('done', 1.0)
     
     def get_letter_probabilities(self, pattern: str, guessed: Set[str]) -> np.ndarray:
         """
@@ -76,6 +152,7 @@ class HangmanOracle:
         Returns:
             np.ndarray of shape (26,) with probabilities for each letter a-z
         """
+        np = get_numpy()
         probs = np.zeros(26, dtype=np.float64)
         L = len(pattern)
         blanks = [i for i, ch in enumerate(pattern) if ch == '_']
@@ -251,5 +328,5 @@ class HangmanOracle:
             Single letter guess (a-z)
         """
         probs = self.get_letter_probabilities(pattern, guessed)
-        best_idx = int(np.argmax(probs))
+        best_idx = int(get_numpy().argmax(probs))
         return chr(97 + best_idx)
@@ -0,0 +1,172 @@
+"""
+Background warm-up for the Hangman Oracle
+Builds HangmanOracle off the request thread and serves FrequencyOracle until it is ready
+"""
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+
+from hangman_oracle import FrequencyOracle
+
+
+class OracleLoader:
+    """
+    Owns the oracle used by the web app.
+
+    status is one of 'idle', 'loading', 'ready' or 'failed'. While no
+    full model has been built, get_oracle() returns the cheap FrequencyOracle.
+    A rebuild keeps serving the previous full model until the new one is done,
+    so the loader stays ready throughout. If a rebuild fails, status goes
+    back to 'ready' (stage 'done') and only error reports the failure.
+    'failed' means no full model could be built; stage then shows where
+    the build stopped.
+
+    A process forked mid-build (e.g. gunicorn --preload) has no build thread,
+    so the child resets the loader to its last finished state.
+    """
+
+    def __init__(self, load_words: Callable[[str], List[str]],
+                 corpus_path: str = 'Data/corpus.txt'):
+        self._load_words = load_words
+        self.corpus_path = corpus_path
+        self.fallback = FrequencyOracle()
+        self.oracle = None
+        self.status = 'idle'
+        self.stage = None
+        self.progress = 0.0
+        self.corpus_size = 0
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._thread = None
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        """Reset build state in a forked child; the parent's build thread is not copied"""
+        # The parent's build thread may have held the lock at fork time
+        self._lock = threading.Lock()
+        if self.status == 'loading':
+            self._finish_without_model()
+
+    def _building(self) -> bool:
+        """True if a build thread is actually running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _finish_without_model(self):
+        """Drop back to the last finished state after a build that did not complete"""
+        if self.oracle is not None:
+            self.status = 'ready'
+            self.stage = 'done'
+            self.progress = 1.0
+        elif self.error is None:
+            self.status = 'idle'
+            self.stage = None
+            self.progress = 0.0
+            self.started_at = None
+        else:
+            self.status = 'failed'
+
+    def start(self, rebuild: bool = False) -> bool:
+        """
+        Start building the oracle in a background thread.
+
+        Args:
+            rebuild: Rebuild even if a full model is already built
+
+        Returns:
+            True if a new build was started, False if one is running or done
+        """
+        with self._lock:
+            if self._building():
+                return False
+            if self.oracle is not None and not rebuild:
+                return False
+            self.status = 'loading'
+            self.stage = 'loading_corpus'
+            self.progress = 0.0
+            self.error = None
+            self.started_at = time.time()
+            self.finished_at = None
+            self._thread = threading.Thread(target=self._build, name='oracle-warmup',
+                                            daemon=True)
+            self._thread.start()
+            return True
+
+    def ensure_started(self):
+        """Start the initial build if nothing has started one yet"""
+        if self.status == 'idle' or (self.status == 'loading' and not self._building()):
+            self.start()
+
+    def _build(self):
+        """Load the corpus and build the full oracle (runs in background thread)"""
+        try:
+            from hangman_oracle import HangmanOracle, get_numpy
+
+            # Import NumPy here rather than on the first request, so a broken
+            # install fails the build and requests keep using the fallback
+            get_numpy()
+            corpus_words = self._load_words(self.corpus_path)
+            oracle = HangmanOracle(corpus_words, progress=self._on_progress)
+        except Exception as e:
+            with self._lock:
+                self.error = str(e)
+                self.finished_at = time.time()
+                self._finish_without_model()
+            return
+
+        with self._lock:
+            self.oracle = oracle
+            self.corpus_size = len(corpus_words)
+            self.status = 'ready'
+            self.stage = 'done'
+            self.progress = 1.0
+            self.finished_at = time.time()
+
+    def _on_progress(self, stage: str, fraction: float):
+        """Progress callback passed to HangmanOracle"""
+        with self._lock:
+            self.stage = stage
+            self.progress = fraction
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the current build finishes; returns True if a full model is served"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.ready
+
+    @property
+    def ready(self) -> bool:
+        return self.oracle is not None
+
+    def get_oracle(self):
+        """
+        Return the oracle to serve and its name.
+
+        Returns:
+            (oracle, name) where name is 'full' or 'fallback'
+        """
+        self.ensure_started()
+        with self._lock:
+            if self.oracle is not None:
+                return self.oracle, 'full'
+            return self.fallback, 'fallback'
+
+    def snapshot(self) -> dict:
+        """Build status for the readiness/health endpoints"""
+        with self._lock:
+            end = self.finished_at or time.time()
+            elapsed = end - self.started_at if self.started_at else 0.0
+            return {
+                'status': self.status,
+                'ready': self.oracle is not None,
+                'model': 'full' if self.oracle is not None else 'fallback',
+                'stage': self.stage,
+                'progress': self.progress,
+                'corpus_size': self.corpus_size,
+                'elapsed_seconds': round(elapsed, 3),
+                'error': self.error
+            }